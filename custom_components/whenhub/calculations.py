@@ -13,7 +13,9 @@ internally, which makes them deterministic and testable with freezegun.
 """
 from __future__ import annotations
 
+from calendar import monthrange
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 from dateutil.rrule import rrule, rruleset, YEARLY, MONTHLY, WEEKLY, DAILY
@@ -37,10 +39,20 @@ def parse_date(date_str: str | date) -> date:
         ValueError: If date_str is a malformed string
     """
     if isinstance(date_str, str):
-        return date.fromisoformat(date_str)
+        return _parse_iso_date(date_str)
     return date_str
 
 
+@lru_cache(maxsize=256)
+def _parse_iso_date(date_str: str) -> date:
+    """Parse an ISO date string, cached per string.
+
+    Config entries store their dates as strings and reparse the same few
+    values on every refresh.
+    """
+    return date.fromisoformat(date_str)
+
+
 # =============================================================================
 # Basic Date Calculations
 # =============================================================================
@@ -55,7 +67,7 @@ def days_until(target_date: date, today: date) -> int:
     Returns:
         Number of days (negative if target is in the past)
     """
-    return (target_date - today).days
+    return target_date.toordinal() - today.toordinal()
 
 
 def days_between(start_date: date, end_date: date) -> int:
@@ -68,7 +80,7 @@ def days_between(start_date: date, end_date: date) -> int:
     Returns:
         Number of days including both start and end date
     """
-    return (end_date - start_date).days + 1
+    return end_date.toordinal() - start_date.toordinal() + 1
 
 
 # =============================================================================
@@ -86,9 +98,11 @@ def trip_left_days(start_date: date, end_date: date, today: date) -> int:
     Returns:
         Days remaining (including today) if trip is active, 0 otherwise
     """
-    if start_date <= today <= end_date:
-        return (end_date - today).days + 1
-    return 0
+    today_ord = today.toordinal()
+    if today_ord < start_date.toordinal():
+        return 0
+    # After the trip the difference goes negative, so clamp at zero
+    return max(0, end_date.toordinal() - today_ord + 1)
 
 
 def trip_left_percent(start_date: date, end_date: date, today: date) -> float:
@@ -102,24 +116,35 @@ def trip_left_percent(start_date: date, end_date: date, today: date) -> float:
     Returns:
         Percentage remaining (100.0 before trip, 0.0 after trip)
     """
-    total_days = (end_date - start_date).days
-    if total_days == 0:
-        # Single day trip
-        if today < start_date:
-            return 100.0
-        elif today > end_date:
-            return 0.0
-        else:
-            return 100.0  # On the day itself
-
-    if today < start_date:
+    return _trip_percent(start_date.toordinal(), end_date.toordinal(), today.toordinal())
+
+
+def _trip_percent(start_ord: int, end_ord: int, today_ord: int) -> float:
+    """Percentage of trip remaining, computed on proleptic ordinals.
+
+    Args:
+        start_ord: Trip start date as date.toordinal()
+        end_ord: Trip end date as date.toordinal()
+        today_ord: Current date as date.toordinal()
+
+    Returns:
+        Percentage remaining (100.0 before trip, 0.0 after trip)
+    """
+    if today_ord < start_ord:
         return 100.0
-    elif today > end_date:
+    if today_ord > end_ord:
         return 0.0
-    else:
-        passed_days = (today - start_date).days
-        remaining_percent = 100.0 - ((passed_days / total_days) * 100.0)
-        return round(remaining_percent, 1)
+
+    total_days = end_ord - start_ord
+    if total_days == 0:
+        # Single day trip, on the day itself
+        return 100.0
+
+    # Remaining share in tenths of a percent, rounded half-up in integer
+    # arithmetic so ties like 81.25 always resolve to 81.3
+    remaining_days = end_ord - today_ord
+    tenths = (remaining_days * 2000 + total_days) // (2 * total_days)
+    return tenths / 10.0
 
 
 def is_trip_active(start_date: date, end_date: date, today: date) -> bool:
@@ -168,7 +193,7 @@ def countdown_breakdown(target_date: date, today: date) -> dict[str, int]:
     if target_date <= today:
         return {"years": 0, "months": 0, "weeks": 0, "days": 0}
 
-    total_days = (target_date - today).days
+    total_days = target_date.toordinal() - today.toordinal()
 
     years = total_days // 365
     remaining = total_days - (years * 365)
@@ -306,6 +331,8 @@ def anniversary_count(original_date: date, today: date) -> int:
 # Special Event Calculations (Easter, Advent)
 # =============================================================================
 
+# Easter and Pentecost sensors recompute the same few years on every refresh
+@lru_cache(maxsize=32)
 def calculate_easter(year: int) -> Optional[date]:
     """Calculate Easter Sunday using the Gauss algorithm.
 
@@ -354,6 +381,7 @@ def calculate_pentecost(year: int) -> Optional[date]:
     return None
 
 
+@lru_cache(maxsize=32)
 def calculate_advent(year: int, advent_num: int) -> Optional[date]:
     """Calculate Advent Sunday date.
 
@@ -476,26 +504,17 @@ def nth_weekday_of_month(year: int, month: int, weekday: int, n: int) -> Optiona
         nth_weekday_of_month(2026, 3, 6, 2)  # 2nd Sunday in March 2026
         -> date(2026, 3, 8)
     """
-    # First day of the month
-    first_day = date(year, month, 1)
-
-    # Weekday of the first day (0=Monday, 6=Sunday)
-    first_weekday = first_day.weekday()
-
-    # Days until the first desired weekday
-    days_until_first = (weekday - first_weekday) % 7
+    # Weekday of the 1st (0=Monday, 6=Sunday) and length of the month
+    first_weekday, days_in_month = monthrange(year, month)
 
-    # Date of the first desired weekday
-    first_occurrence = first_day + timedelta(days=days_until_first)
-
-    # nth occurrence (n-1 weeks after the first)
-    result = first_occurrence + timedelta(weeks=n - 1)
+    # Day of the first desired weekday, then n-1 weeks later
+    day = 1 + (weekday - first_weekday) % 7 + 7 * (n - 1)
 
     # Check if still in the same month
-    if result.month != month:
+    if day < 1 or day > days_in_month:
         return None
 
-    return result
+    return date(year, month, day)
 
 
 def last_weekday_of_month(year: int, month: int, weekday: int) -> date:
@@ -513,19 +532,15 @@ def last_weekday_of_month(year: int, month: int, weekday: int) -> date:
         last_weekday_of_month(2026, 10, 6)  # Last Sunday in October 2026
         -> date(2026, 10, 25)
     """
-    # Last day of the month
-    if month == 12:
-        last_day = date(year + 1, 1, 1) - timedelta(days=1)
-    else:
-        last_day = date(year, month + 1, 1) - timedelta(days=1)
+    first_weekday, days_in_month = monthrange(year, month)
 
     # Weekday of the last day
-    last_weekday = last_day.weekday()
+    last_weekday = (first_weekday + days_in_month - 1) % 7
 
     # Days back to the desired weekday
     days_back = (last_weekday - weekday) % 7
 
-    return last_day - timedelta(days=days_back)
+    return date(year, month, days_in_month - days_back)
 
 
 def calculate_dst_date(region_info: dict, dst_type: str, year: int) -> Optional[date]:
@@ -557,10 +572,21 @@ def calculate_dst_date(region_info: dict, dst_type: str, year: int) -> Optional[
     if not month:
         return None
 
+    return _dst_rule_date(rule, month, weekday, rule_info.get("n", 1), year)
+
+
+@lru_cache(maxsize=64)
+def _dst_rule_date(
+    rule: str | None, month: int, weekday: int, n: int, year: int
+) -> Optional[date]:
+    """Resolve a DST rule to its date, cached per rule and year.
+
+    Region dicts are not hashable, so calculate_dst_date unpacks the rule
+    and the cache is keyed on its plain values instead.
+    """
     if rule == "last":
         return last_weekday_of_month(year, month, weekday)
     elif rule == "nth":
-        n = rule_info.get("n", 1)
         return nth_weekday_of_month(year, month, weekday, n)
 
     return None
@@ -675,23 +701,22 @@ def is_dst_active(region_info: dict, today: date) -> bool:
         is_dst_active(DST_REGIONS["eu"], date(2026, 12, 1))
         -> False  # Winter time active
     """
-    # Last summer time transition
-    last_summer = last_dst_event(region_info, "next_summer", today)
-    # Last winter time transition
-    last_winter = last_dst_event(region_info, "next_winter", today)
+    # This year's transitions; both rules repeat every year
+    summer = calculate_dst_date(region_info, "summer", today.year)
+    winter = calculate_dst_date(region_info, "winter", today.year)
 
     # If no events found
-    if last_summer is None and last_winter is None:
-        return False
-    if last_summer is None:
-        return False  # Only winter time known -> winter time active
-    if last_winter is None:
+    if summer is None:
+        return False  # No summer time known -> winter time active
+    if winter is None:
         return True   # Only summer time known -> summer time active
 
-    # The more recent event determines the current state
-    # If summer time was last -> summer time active
-    # If winter time was last -> winter time active
-    return last_summer > last_winter
+    # Northern hemisphere: summer time runs from spring to autumn.
+    # Southern hemisphere: it spans the new year, so it is active
+    # before this year's winter transition or from the summer one on.
+    if summer < winter:
+        return summer <= today < winter
+    return today >= summer or today < winter
 
 
 # =============================================================================
@@ -97,6 +97,16 @@ _IMAGE_MIME_MAP = {
 # Maximum allowed image file size (5 MB). Larger files would bloat the config entry JSON.
 _MAX_IMAGE_SIZE_BYTES = 5 * 1024 * 1024
 
+# The event type form never varies, so it is built once at import.
+_EVENT_TYPE_SCHEMA = vol.Schema({
+    vol.Required(CONF_EVENT_TYPE): SelectSelector(
+        SelectSelectorConfig(
+            options=list(EVENT_TYPES.keys()) + [ENTRY_TYPE_CALENDAR],
+            translation_key="event_type",
+        )
+    )
+})
+
 
 def _process_image_upload(hass: HomeAssistant, user_input: dict) -> tuple[str | None, str | None, str | None]:
     """Process an uploaded image file from a FileSelector field.
@@ -382,20 +392,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _show_event_type_form(self) -> FlowResult:
         """Show event type selection form."""
-        event_type_options = list(EVENT_TYPES.keys()) + [ENTRY_TYPE_CALENDAR]
-
-        data_schema = vol.Schema({
-            vol.Required(CONF_EVENT_TYPE): SelectSelector(
-                SelectSelectorConfig(
-                    options=event_type_options,
-                    translation_key="event_type",
-                )
-            )
-        })
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=_EVENT_TYPE_SCHEMA,
         )
 
     def _suggest_calendar_name(self) -> str:
@@ -1,14 +1,14 @@
 """Base sensor classes for WhenHub integration.
 
 This module provides the foundation classes for all WhenHub sensors, including
-common functionality like device info creation, error handling, and countdown
+common functionality like device info creation, base attributes, and countdown
 text formatting that is shared across Trip, Milestone, and Anniversary sensors.
 """
 from __future__ import annotations
 
 import logging
 from datetime import date
-from typing import Any, Callable, TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -165,26 +165,6 @@ class BaseSensor(CoordinatorEntity["WhenHubCoordinator"], SensorEntity):
         """
         return get_device_info(self._config_entry, self._event_data)
 
-    def _safe_calculate(self, calculation_func: Callable, fallback: Any = None) -> Any:
-        """Safely execute calculation with error handling and logging.
-
-        Wraps sensor value calculations to prevent integration failures from
-        calculation errors (e.g. invalid dates, arithmetic errors).
-
-        Args:
-            calculation_func: Function that performs the calculation
-            fallback: Value to return if calculation fails (default: None)
-
-        Returns:
-            Result of calculation_func() or fallback value on error
-        """
-        try:
-            return calculation_func()
-        except Exception as err:
-            _LOGGER.warning("Calculation error in %s sensor %s: %s",
-                           self._config_entry.title, self._sensor_type, err)
-            return fallback
-
     def _get_base_attributes(self) -> dict[str, Any]:
         """Get common base attributes for countdown sensors.
 
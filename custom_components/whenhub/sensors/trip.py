@@ -26,6 +26,15 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maps each trip sensor type to the coordinator.data key holding its value
+_DATA_KEYS = {
+    "days_until": "days_until",
+    "days_until_end": "days_until_end",
+    "event_date": "start_date",
+    "trip_left_days": "trip_left_days",
+    "trip_left_percent": "trip_left_percent",
+}
+
 
 class TripSensor(BaseCountdownSensor):
     """Sensor for multi-day trip events.
@@ -56,6 +65,7 @@ class TripSensor(BaseCountdownSensor):
             sensor_type: Type of sensor to create (from TRIP_SENSOR_TYPES)
         """
         super().__init__(coordinator, config_entry, event_data, sensor_type, TRIP_SENSOR_TYPES)
+        self._data_key = _DATA_KEYS.get(sensor_type)
 
     @property
     def icon(self) -> str | None:
@@ -75,21 +85,10 @@ class TripSensor(BaseCountdownSensor):
             Sensor value appropriate for the sensor type (datetime, int for days, float for percent)
         """
         data = self.coordinator.data
-        if not data:
+        if not data or self._data_key is None:
             return None
 
-        if self._sensor_type == "days_until":
-            return data.get("days_until")
-        elif self._sensor_type == "days_until_end":
-            return data.get("days_until_end")
-        elif self._sensor_type == "event_date":
-            return data.get("start_date")
-        elif self._sensor_type == "trip_left_days":
-            return data.get("trip_left_days")
-        elif self._sensor_type == "trip_left_percent":
-            return data.get("trip_left_percent")
-
-        return None
+        return data.get(self._data_key)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -25,6 +25,27 @@ def get_date_from_state(state_value: str) -> str:
         return state_value.split("T")[0]
     return state_value
 
+
+def snapshot_states(hass, prefix: str = "") -> dict:
+    """Collect current entity states in a single pass.
+
+    Use this after setup when a test asserts on many entities, instead of
+    calling hass.states.get() once per entity.
+
+    Args:
+        hass: Home Assistant instance
+        prefix: Only include entities whose object_id starts with this
+            (e.g. "danemark_2026" matches sensor.* and binary_sensor.*)
+
+    Returns:
+        Dictionary mapping entity_id to State object
+    """
+    return {
+        state.entity_id: state
+        for state in hass.states.async_all()
+        if state.object_id.startswith(prefix)
+    }
+
 # Use pytest-homeassistant-custom-component plugin
 pytest_plugins = "pytest_homeassistant_custom_component"
 
@@ -34,6 +55,33 @@ def auto_enable_custom_integrations(enable_custom_integrations):
     """Enable loading of custom integrations in Home Assistant."""
     return enable_custom_integrations
 
+@pytest.fixture
+def fast_freeze_date(monkeypatch):
+    """Pin date.today() in the integration without freezegun.
+
+    Returns a callable taking an ISO date string. It replaces the ``date``
+    reference in the coordinator and calendar modules with a subclass whose
+    today() returns that date. Only use it for tests that depend on the
+    current date alone; tests that need datetime.now() or HA's clock must
+    keep using freeze_time.
+    """
+    from datetime import date
+
+    from custom_components.whenhub import calendar, coordinator
+
+    def _freeze(day_str: str) -> None:
+        frozen = date.fromisoformat(day_str)
+
+        class _FrozenDate(date):
+            @classmethod
+            def today(cls):
+                return frozen
+
+        monkeypatch.setattr(coordinator, "date", _FrozenDate)
+        monkeypatch.setattr(calendar, "date", _FrozenDate)
+
+    return _freeze
+
 @pytest.fixture
 def trip_config_entry():
     """Create a mock config entry for a trip event."""
@@ -1,6 +1,6 @@
 """Basic logic tests that work without Home Assistant."""
+import calendar
 import pytest
-from freezegun import freeze_time
 from datetime import date, timedelta
 import sys
 import os
@@ -15,30 +15,30 @@ from custom_components.whenhub.const import SPECIAL_EVENTS
 def test_special_events_structure():
     """Test that special events are properly defined."""
     assert "christmas_eve" in SPECIAL_EVENTS
-    assert SPECIAL_EVENTS["christmas_eve"]["name"] == "Heilig Abend"
-    assert SPECIAL_EVENTS["christmas_eve"]["month"] == 12
-    assert SPECIAL_EVENTS["christmas_eve"]["day"] == 24
+    christmas_eve = SPECIAL_EVENTS["christmas_eve"]
+    assert christmas_eve["name"] == "Heilig Abend"
+    assert christmas_eve["month"] == 12
+    assert christmas_eve["day"] == 24
 
     # Test Easter is calculated type
-    assert SPECIAL_EVENTS["easter"]["type"] == "calculated"
-    assert SPECIAL_EVENTS["easter"]["calculation"] == "easter"
+    easter = SPECIAL_EVENTS["easter"]
+    assert easter["type"] == "calculated"
+    assert easter["calculation"] == "easter"
 
 
 def test_date_calculations():
     """Test basic date calculation logic."""
     # Test days until calculation
-    with freeze_time("2026-12-01"):
-        today = date(2026, 12, 1)
-        christmas = date(2026, 12, 24)
-        days_until = (christmas - today).days
-        assert days_until == 23
-        
-    # Test anniversary year calculation  
-    with freeze_time("2026-05-20"):
-        original_date = date(2010, 5, 20)
-        today = date(2026, 5, 20)
-        years_passed = today.year - original_date.year
-        assert years_passed == 16
+    today = date(2026, 12, 1)
+    christmas = date(2026, 12, 24)
+    days_until = (christmas - today).days
+    assert days_until == 23
+
+    # Test anniversary year calculation
+    original_date = date(2010, 5, 20)
+    today = date(2026, 5, 20)
+    years_passed = today.year - original_date.year
+    assert years_passed == 16
 
 
 def test_countdown_text_formatting():
@@ -72,13 +72,10 @@ def test_leap_year_handling():
     
     # Calculate next anniversary in non-leap year
     def get_anniversary_date(original_date: date, target_year: int) -> date:
-        try:
-            return date(target_year, original_date.month, original_date.day)
-        except ValueError:
+        if original_date.month == 2 and original_date.day == 29 and not calendar.isleap(target_year):
             # Feb 29 in non-leap year -> use Feb 28
-            if original_date.month == 2 and original_date.day == 29:
-                return date(target_year, 2, 28)
-            raise
+            return date(target_year, 2, 28)
+        return date(target_year, original_date.month, original_date.day)
     
     assert get_anniversary_date(original, 2023) == date(2023, 2, 28)
     assert get_anniversary_date(original, 2024) == date(2024, 2, 29)
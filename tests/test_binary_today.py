@@ -1,117 +1,102 @@
 """Test binary sensor 'is today' functionality for WhenHub integration."""
 import pytest
-from freezegun import freeze_time
 from homeassistant.core import HomeAssistant
 
-@pytest.mark.asyncio
-async def test_trip_starts_today(hass: HomeAssistant, trip_config_entry):
-    """Test binary sensor on when trip starts today."""
-    trip_config_entry.add_to_hass(hass)
-    
-    with freeze_time("2026-07-12 10:00:00+00:00"):  # Trip start date
-        assert await hass.config_entries.async_setup(trip_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        # Trip starts today should be on
-        starts = hass.states.get("binary_sensor.danemark_2026_trip_starts_today")
-        assert starts is not None
-        assert starts.state == "on"
-        
-        # Trip active should also be on
-        active = hass.states.get("binary_sensor.danemark_2026_trip_active_today")
-        assert active is not None
-        assert active.state == "on"
-        
-        # Trip ends today should be off
-        ends = hass.states.get("binary_sensor.danemark_2026_trip_ends_today")
-        assert ends is not None
-        assert ends.state == "off"
-
-@pytest.mark.asyncio
-async def test_trip_ends_today(hass: HomeAssistant, trip_config_entry):
-    """Test binary sensor on when trip ends today."""
+from conftest import snapshot_states
+
+TRIP_STARTS_TODAY = "binary_sensor.danemark_2026_trip_starts_today"
+TRIP_ACTIVE_TODAY = "binary_sensor.danemark_2026_trip_active_today"
+TRIP_ENDS_TODAY = "binary_sensor.danemark_2026_trip_ends_today"
+MILESTONE_IS_TODAY = "binary_sensor.projektabgabe_is_today"
+ANNIVERSARY_IS_TODAY = "binary_sensor.geburtstag_max_is_today"
+CHRISTMAS_IS_TODAY = "binary_sensor.weihnachts_countdown_is_today"
+
+
+@pytest.mark.parametrize(
+    ("day", "starts", "active", "ends"),
+    [
+        pytest.param("2026-07-11", "off", "off", "off", id="day_before_start"),
+        pytest.param("2026-07-12", "on", "on", "off", id="start_day"),
+        pytest.param("2026-07-20", "off", "on", "off", id="middle"),
+        pytest.param("2026-07-26", "off", "on", "on", id="end_day"),
+    ],
+)
+async def test_trip_day_flags(
+    hass: HomeAssistant, trip_config_entry, fast_freeze_date, day, starts, active, ends
+):
+    """Test trip starts/active/ends binary sensors around the trip dates."""
     trip_config_entry.add_to_hass(hass)
-    
-    with freeze_time("2026-07-26 10:00:00+00:00"):  # Trip end date
-        assert await hass.config_entries.async_setup(trip_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        # Trip ends today should be on
-        ends = hass.states.get("binary_sensor.danemark_2026_trip_ends_today")
-        assert ends is not None
-        assert ends.state == "on"
-        
-        # Trip active should still be on (last day)
-        active = hass.states.get("binary_sensor.danemark_2026_trip_active_today")
-        assert active is not None
-        assert active.state == "on"
-        
-        # Trip starts today should be off
-        starts = hass.states.get("binary_sensor.danemark_2026_trip_starts_today")
-        assert starts is not None
-        assert starts.state == "off"
-
-@pytest.mark.asyncio
-async def test_milestone_is_today_true(hass: HomeAssistant, milestone_config_entry):
+    fast_freeze_date(day)
+
+    assert await hass.config_entries.async_setup(trip_config_entry.entry_id)
+    await hass.async_block_till_done()
+    states = snapshot_states(hass, "danemark_2026")
+
+    for entity_id, expected in (
+        (TRIP_STARTS_TODAY, starts),
+        (TRIP_ACTIVE_TODAY, active),
+        (TRIP_ENDS_TODAY, ends),
+    ):
+        state = states.get(entity_id)
+        assert state is not None
+        assert state.state == expected, entity_id
+
+async def test_milestone_is_today_true(hass: HomeAssistant, milestone_config_entry, fast_freeze_date):
     """Test milestone binary sensor on target date."""
     milestone_config_entry.add_to_hass(hass)
-    
-    with freeze_time("2026-03-15 10:00:00+00:00"):  # Target date
-        assert await hass.config_entries.async_setup(milestone_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        binary = hass.states.get("binary_sensor.projektabgabe_is_today")
-        assert binary is not None
-        assert binary.state == "on"
-
-@pytest.mark.asyncio
-async def test_milestone_is_today_false(hass: HomeAssistant, milestone_config_entry):
+    fast_freeze_date("2026-03-15")  # Target date
+
+    assert await hass.config_entries.async_setup(milestone_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    binary = hass.states.get(MILESTONE_IS_TODAY)
+    assert binary is not None
+    assert binary.state == "on"
+
+async def test_milestone_is_today_false(hass: HomeAssistant, milestone_config_entry, fast_freeze_date):
     """Test milestone binary sensor on other dates."""
     milestone_config_entry.add_to_hass(hass)
-    
-    with freeze_time("2026-03-14 10:00:00+00:00"):  # Day before
-        assert await hass.config_entries.async_setup(milestone_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        binary = hass.states.get("binary_sensor.projektabgabe_is_today")
-        assert binary is not None
-        assert binary.state == "off"
-
-@pytest.mark.asyncio
-async def test_anniversary_is_today(hass: HomeAssistant, anniversary_config_entry):
+    fast_freeze_date("2026-03-14")  # Day before
+
+    assert await hass.config_entries.async_setup(milestone_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    binary = hass.states.get(MILESTONE_IS_TODAY)
+    assert binary is not None
+    assert binary.state == "off"
+
+async def test_anniversary_is_today(hass: HomeAssistant, anniversary_config_entry, fast_freeze_date):
     """Test anniversary binary sensor on anniversary date."""
     anniversary_config_entry.add_to_hass(hass)
-    
-    with freeze_time("2026-05-20 10:00:00+00:00"):  # Anniversary date
-        assert await hass.config_entries.async_setup(anniversary_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        binary = hass.states.get("binary_sensor.geburtstag_max_is_today")
-        assert binary is not None
-        assert binary.state == "on"
-
-@pytest.mark.asyncio
-async def test_special_christmas_is_today(hass: HomeAssistant, special_config_entry):
+    fast_freeze_date("2026-05-20")  # Anniversary date
+
+    assert await hass.config_entries.async_setup(anniversary_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    binary = hass.states.get(ANNIVERSARY_IS_TODAY)
+    assert binary is not None
+    assert binary.state == "on"
+
+async def test_special_christmas_is_today(hass: HomeAssistant, special_config_entry, fast_freeze_date):
     """Test special event binary sensor on Christmas Eve."""
     special_config_entry.add_to_hass(hass)
-    
-    with freeze_time("2026-12-24 10:00:00+00:00"):  # Christmas Eve
-        assert await hass.config_entries.async_setup(special_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        binary = hass.states.get("binary_sensor.weihnachts_countdown_is_today")
-        assert binary is not None
-        assert binary.state == "on"
-
-@pytest.mark.asyncio
-async def test_special_christmas_not_today(hass: HomeAssistant, special_config_entry):
+    fast_freeze_date("2026-12-24")  # Christmas Eve
+
+    assert await hass.config_entries.async_setup(special_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    binary = hass.states.get(CHRISTMAS_IS_TODAY)
+    assert binary is not None
+    assert binary.state == "on"
+
+async def test_special_christmas_not_today(hass: HomeAssistant, special_config_entry, fast_freeze_date):
     """Test special event binary sensor on other days."""
     special_config_entry.add_to_hass(hass)
-    
-    with freeze_time("2026-12-23 10:00:00+00:00"):  # Day before Christmas Eve
-        assert await hass.config_entries.async_setup(special_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        binary = hass.states.get("binary_sensor.weihnachts_countdown_is_today")
-        assert binary is not None
-        assert binary.state == "off"
\ No newline at end of file
+    fast_freeze_date("2026-12-23")  # Day before Christmas Eve
+
+    assert await hass.config_entries.async_setup(special_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    binary = hass.states.get(CHRISTMAS_IS_TODAY)
+    assert binary is not None
+    assert binary.state == "off"
\ No newline at end of file
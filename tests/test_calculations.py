@@ -1,15 +1,12 @@
 """Unit tests for calculations.py - pure Python date calculation functions.
 
 These tests verify the calculation logic in isolation, without Home Assistant
-dependencies. Uses freezegun to control the current date for deterministic tests.
+dependencies. Every function takes "today" as an argument, so no clock freezing
+is needed here. No test shares state with another, so the module is safe under
+pytest-xdist.
 """
 import pytest
 from datetime import date
-import sys
-import os
-
-# Add parent directory to path to import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from custom_components.whenhub.calculations import (
     parse_date,
@@ -40,6 +37,13 @@ from custom_components.whenhub.calculations import (
     is_dst_active,
 )
 
+# Shared 11-day trip used by TestTripCalculations
+TRIP_START = date(2025, 6, 10)
+TRIP_END = date(2025, 6, 20)
+BEFORE_TRIP = date(2025, 6, 5)
+MID_TRIP = date(2025, 6, 15)
+AFTER_TRIP = date(2025, 6, 25)
+
 
 class TestParseDate:
     """Tests for parse_date function."""
@@ -105,55 +109,43 @@ class TestDaysBetween:
 class TestTripCalculations:
     """Tests for trip-related calculations."""
 
-    def test_trip_left_days_before_trip(self):
-        """Test days left before trip starts."""
-        start = date(2025, 6, 10)
-        end = date(2025, 6, 20)
-        today = date(2025, 6, 5)
-        assert trip_left_days(start, end, today) == 0
-
-    def test_trip_left_days_during_trip(self):
-        """Test days left during active trip."""
-        start = date(2025, 6, 10)
-        end = date(2025, 6, 20)
-        today = date(2025, 6, 15)
-        assert trip_left_days(start, end, today) == 6  # 15-20 inclusive
-
-    def test_trip_left_days_on_last_day(self):
-        """Test days left on last day of trip."""
-        start = date(2025, 6, 10)
-        end = date(2025, 6, 20)
-        today = date(2025, 6, 20)
-        assert trip_left_days(start, end, today) == 1
-
-    def test_trip_left_days_after_trip(self):
-        """Test days left after trip ends."""
-        start = date(2025, 6, 10)
-        end = date(2025, 6, 20)
-        today = date(2025, 6, 25)
-        assert trip_left_days(start, end, today) == 0
-
-    def test_trip_left_percent_before_trip(self):
-        """Test percent left before trip is 100%."""
-        start = date(2025, 6, 10)
-        end = date(2025, 6, 20)
-        today = date(2025, 6, 5)
-        assert trip_left_percent(start, end, today) == 100.0
-
-    def test_trip_left_percent_after_trip(self):
-        """Test percent left after trip is 0%."""
-        start = date(2025, 6, 10)
-        end = date(2025, 6, 20)
-        today = date(2025, 6, 25)
-        assert trip_left_percent(start, end, today) == 0.0
+    @pytest.mark.parametrize(
+        ("today", "expected"),
+        [
+            pytest.param(BEFORE_TRIP, 0, id="before_trip"),
+            pytest.param(MID_TRIP, 6, id="during_trip"),  # 15-20 inclusive
+            pytest.param(TRIP_END, 1, id="on_last_day"),
+            pytest.param(AFTER_TRIP, 0, id="after_trip"),
+        ],
+    )
+    def test_trip_left_days(self, today, expected):
+        """Test days left before, during, on the last day of and after a trip."""
+        assert trip_left_days(TRIP_START, TRIP_END, today) == expected
+
+    @pytest.mark.parametrize(
+        ("today", "expected"),
+        [
+            pytest.param(BEFORE_TRIP, 100.0, id="before_trip"),
+            pytest.param(TRIP_START, 100.0, id="on_first_day"),
+            pytest.param(TRIP_END, 0.0, id="on_last_day"),
+            pytest.param(AFTER_TRIP, 0.0, id="after_trip"),
+        ],
+    )
+    def test_trip_left_percent(self, today, expected):
+        """Test percent left at the trip boundaries."""
+        assert trip_left_percent(TRIP_START, TRIP_END, today) == expected
 
     def test_trip_left_percent_during_trip(self):
         """Test percent left during trip."""
-        start = date(2025, 6, 10)
-        end = date(2025, 6, 20)
-        today = date(2025, 6, 15)  # 5 days in, 5 to go
-        result = trip_left_percent(start, end, today)
-        assert 40 < result < 60  # Approximately 50%
+        # 5 of the 10 day-steps from start to end remain
+        assert trip_left_percent(TRIP_START, TRIP_END, MID_TRIP) == 50.0
+
+    def test_trip_left_percent_rounds_half_up(self):
+        """Test exact .x5 ties round up (13 of 16 days left = 81.25%)."""
+        start = date(2025, 6, 1)
+        end = date(2025, 6, 17)
+        today = date(2025, 6, 4)
+        assert trip_left_percent(start, end, today) == 81.3
 
     def test_trip_left_percent_single_day(self):
         """Test percent for single day trip."""
@@ -162,38 +154,19 @@ class TestTripCalculations:
         assert trip_left_percent(day, day, date(2025, 6, 10)) == 100.0
         assert trip_left_percent(day, day, date(2025, 6, 11)) == 0.0
 
-    def test_is_trip_active_before(self):
-        """Test trip not active before start."""
-        start = date(2025, 6, 10)
-        end = date(2025, 6, 20)
-        today = date(2025, 6, 5)
-        assert is_trip_active(start, end, today) is False
-
-    def test_is_trip_active_during(self):
-        """Test trip active during period."""
-        start = date(2025, 6, 10)
-        end = date(2025, 6, 20)
-        today = date(2025, 6, 15)
-        assert is_trip_active(start, end, today) is True
-
-    def test_is_trip_active_on_start(self):
-        """Test trip active on start date."""
-        start = date(2025, 6, 10)
-        end = date(2025, 6, 20)
-        assert is_trip_active(start, end, start) is True
-
-    def test_is_trip_active_on_end(self):
-        """Test trip active on end date."""
-        start = date(2025, 6, 10)
-        end = date(2025, 6, 20)
-        assert is_trip_active(start, end, end) is True
-
-    def test_is_trip_active_after(self):
-        """Test trip not active after end."""
-        start = date(2025, 6, 10)
-        end = date(2025, 6, 20)
-        today = date(2025, 6, 25)
-        assert is_trip_active(start, end, today) is False
+    @pytest.mark.parametrize(
+        ("today", "expected"),
+        [
+            pytest.param(BEFORE_TRIP, False, id="before"),
+            pytest.param(TRIP_START, True, id="on_start"),
+            pytest.param(MID_TRIP, True, id="during"),
+            pytest.param(TRIP_END, True, id="on_end"),
+            pytest.param(AFTER_TRIP, False, id="after"),
+        ],
+    )
+    def test_is_trip_active(self, today, expected):
+        """Test trip is active from start through end date inclusive."""
+        assert is_trip_active(TRIP_START, TRIP_END, today) is expected
 
 
 class TestIsDateToday:
@@ -232,18 +205,14 @@ class TestCountdownBreakdown:
         today = date(2025, 6, 1)
         target = date(2025, 6, 5)
         result = countdown_breakdown(target, today)
-        assert result["days"] == 4
-        assert result["weeks"] == 0
-        assert result["months"] == 0
-        assert result["years"] == 0
+        assert result == {"years": 0, "months": 0, "weeks": 0, "days": 4}
 
     def test_weeks_and_days(self):
         """Test weeks and days breakdown."""
         today = date(2025, 6, 1)
         target = date(2025, 6, 20)  # 19 days = 2 weeks + 5 days
         result = countdown_breakdown(target, today)
-        assert result["weeks"] == 2
-        assert result["days"] == 5
+        assert result == {"years": 0, "months": 0, "weeks": 2, "days": 5}
 
     def test_year_plus(self):
         """Test over a year breakdown."""
@@ -267,126 +236,74 @@ class TestFormatCountdownText:
         day = date(2025, 6, 15)
         assert format_countdown_text(day, day) == "0 Tage"
 
-    def test_singular_day(self):
-        """Test singular 'Tag'."""
-        today = date(2025, 6, 1)
-        target = date(2025, 6, 2)
-        result = format_countdown_text(target, today)
-        assert "1 Tag" in result
-
-    def test_plural_days(self):
-        """Test plural 'Tage'."""
-        today = date(2025, 6, 1)
-        target = date(2025, 6, 5)
-        result = format_countdown_text(target, today)
-        assert "4 Tage" in result
-
-    def test_singular_week(self):
-        """Test singular 'Woche'."""
-        today = date(2025, 6, 1)
-        target = date(2025, 6, 8)  # 7 days = 1 week
-        result = format_countdown_text(target, today)
-        assert "1 Woche" in result
-
-    def test_singular_month(self):
-        """Test singular 'Monat'."""
-        today = date(2025, 6, 1)
-        target = date(2025, 7, 1)  # 30 days = 1 month
-        result = format_countdown_text(target, today)
-        assert "1 Monat" in result
-
-    def test_singular_year(self):
-        """Test singular 'Jahr'."""
-        today = date(2025, 1, 1)
-        target = date(2026, 1, 1)  # 365 days = 1 year
-        result = format_countdown_text(target, today)
-        assert "1 Jahr" in result
-
-    def test_complex_countdown(self):
-        """Test complex countdown with multiple components."""
-        today = date(2025, 1, 1)
-        target = date(2027, 5, 15)  # About 2 years, 4 months, etc.
-        result = format_countdown_text(target, today)
-        assert "Jahre" in result  # Plural
+    @pytest.mark.parametrize(
+        ("today", "target", "expected"),
+        [
+            pytest.param(date(2025, 6, 1), date(2025, 6, 2), "1 Tag", id="singular_day"),
+            pytest.param(date(2025, 6, 1), date(2025, 6, 5), "4 Tage", id="plural_days"),
+            pytest.param(date(2025, 6, 1), date(2025, 6, 8), "1 Woche", id="singular_week"),  # 7 days
+            pytest.param(date(2025, 6, 1), date(2025, 7, 1), "1 Monat", id="singular_month"),  # 30 days
+            pytest.param(date(2025, 1, 1), date(2026, 1, 1), "1 Jahr", id="singular_year"),  # 365 days
+            # 864 days = 2 years (730) + 4 months (120) + 2 weeks (14)
+            pytest.param(
+                date(2025, 1, 1), date(2027, 5, 15), "2 Jahre, 4 Monate, 2 Wochen", id="complex_countdown"
+            ),
+        ],
+    )
+    def test_countdown_text(self, today, target, expected):
+        """Test exact countdown text including singular/plural forms."""
+        assert format_countdown_text(target, today) == expected
 
 
 class TestAnniversaryForYear:
     """Tests for anniversary_for_year function."""
 
-    def test_normal_date(self):
-        """Test normal date anniversary."""
-        original = date(2000, 6, 15)
-        result = anniversary_for_year(original, 2025)
-        assert result == date(2025, 6, 15)
-
-    def test_leap_year_birthday_in_leap_year(self):
-        """Test Feb 29 birthday in leap year."""
-        original = date(2000, 2, 29)
-        result = anniversary_for_year(original, 2024)  # 2024 is leap year
-        assert result == date(2024, 2, 29)
-
-    def test_leap_year_birthday_in_non_leap_year(self):
-        """Test Feb 29 birthday in non-leap year falls back to Feb 28."""
-        original = date(2000, 2, 29)
-        result = anniversary_for_year(original, 2025)  # 2025 is not leap year
-        assert result == date(2025, 2, 28)
+    @pytest.mark.parametrize(
+        ("original", "year", "expected"),
+        [
+            pytest.param(date(2000, 6, 15), 2025, date(2025, 6, 15), id="normal_date"),
+            # 2024 is a leap year
+            pytest.param(date(2000, 2, 29), 2024, date(2024, 2, 29), id="leap_birthday_in_leap_year"),
+            # 2025 is not, so Feb 29 falls back to Feb 28
+            pytest.param(date(2000, 2, 29), 2025, date(2025, 2, 28), id="leap_birthday_in_non_leap_year"),
+        ],
+    )
+    def test_anniversary_for_year(self, original, year, expected):
+        """Test the anniversary date for a given year."""
+        assert anniversary_for_year(original, year) == expected
 
 
 class TestNextAnniversary:
     """Tests for next_anniversary function."""
 
-    def test_anniversary_this_year_future(self):
-        """Test anniversary later this year."""
-        original = date(2000, 12, 25)
-        today = date(2025, 6, 15)
-        result = next_anniversary(original, today)
-        assert result == date(2025, 12, 25)
-
-    def test_anniversary_this_year_past(self):
-        """Test anniversary already passed this year."""
-        original = date(2000, 3, 15)
-        today = date(2025, 6, 15)
-        result = next_anniversary(original, today)
-        assert result == date(2026, 3, 15)
-
-    def test_anniversary_today(self):
-        """Test anniversary is today."""
-        original = date(2000, 6, 15)
-        today = date(2025, 6, 15)
-        result = next_anniversary(original, today)
-        assert result == date(2025, 6, 15)
+    @pytest.mark.parametrize(
+        ("original", "expected"),
+        [
+            pytest.param(date(2000, 12, 25), date(2025, 12, 25), id="this_year_future"),
+            pytest.param(date(2000, 3, 15), date(2026, 3, 15), id="this_year_past"),
+            pytest.param(date(2000, 6, 15), date(2025, 6, 15), id="today"),
+        ],
+    )
+    def test_next_anniversary(self, original, expected):
+        """Test next anniversary seen from 2025-06-15."""
+        assert next_anniversary(original, date(2025, 6, 15)) == expected
 
 
 class TestLastAnniversary:
     """Tests for last_anniversary function."""
 
-    def test_original_in_future(self):
-        """Test original date in future returns None."""
-        original = date(2030, 6, 15)
-        today = date(2025, 6, 15)
-        result = last_anniversary(original, today)
-        assert result is None
-
-    def test_anniversary_this_year_passed(self):
-        """Test anniversary passed this year."""
-        original = date(2000, 3, 15)
-        today = date(2025, 6, 15)
-        result = last_anniversary(original, today)
-        assert result == date(2025, 3, 15)
-
-    def test_anniversary_today(self):
-        """Test anniversary is today returns today."""
-        original = date(2000, 6, 15)
-        today = date(2025, 6, 15)
-        result = last_anniversary(original, today)
-        assert result == date(2025, 6, 15)
-
-    def test_anniversary_not_yet_this_year(self):
-        """Test anniversary not yet this year returns last year."""
-        original = date(2000, 12, 25)
-        today = date(2025, 6, 15)
-        result = last_anniversary(original, today)
-        assert result == date(2024, 12, 25)
+    @pytest.mark.parametrize(
+        ("original", "expected"),
+        [
+            pytest.param(date(2030, 6, 15), None, id="original_in_future"),
+            pytest.param(date(2000, 3, 15), date(2025, 3, 15), id="this_year_passed"),
+            pytest.param(date(2000, 6, 15), date(2025, 6, 15), id="today"),
+            pytest.param(date(2000, 12, 25), date(2024, 12, 25), id="not_yet_this_year"),
+        ],
+    )
+    def test_last_anniversary(self, original, expected):
+        """Test last anniversary seen from 2025-06-15."""
+        assert last_anniversary(original, date(2025, 6, 15)) == expected
 
 
 class TestAnniversaryCount:
@@ -668,53 +585,23 @@ class TestLastWeekdayOfMonth:
 class TestCalculateDstDate:
     """Tests for calculate_dst_date function."""
 
-    def test_eu_summer_2026(self):
-        """EU summer time 2026 = March 29th."""
-        region = DST_REGIONS_TEST["eu"]
-        result = calculate_dst_date(region, "summer", 2026)
-        assert result == date(2026, 3, 29)
-
-    def test_eu_winter_2026(self):
-        """EU winter time 2026 = October 25th."""
-        region = DST_REGIONS_TEST["eu"]
-        result = calculate_dst_date(region, "winter", 2026)
-        assert result == date(2026, 10, 25)
-
-    def test_usa_summer_2026(self):
-        """USA summer time 2026 = March 8th."""
-        region = DST_REGIONS_TEST["usa"]
-        result = calculate_dst_date(region, "summer", 2026)
-        assert result == date(2026, 3, 8)
-
-    def test_usa_winter_2026(self):
-        """USA winter time 2026 = November 1st."""
-        region = DST_REGIONS_TEST["usa"]
-        result = calculate_dst_date(region, "winter", 2026)
-        assert result == date(2026, 11, 1)
-
-    def test_australia_summer_2026(self):
-        """Australia summer time 2026 = October 4th."""
-        region = DST_REGIONS_TEST["australia"]
-        result = calculate_dst_date(region, "summer", 2026)
-        assert result == date(2026, 10, 4)
-
-    def test_australia_winter_2026(self):
-        """Australia winter time 2026 = April 5th."""
-        region = DST_REGIONS_TEST["australia"]
-        result = calculate_dst_date(region, "winter", 2026)
-        assert result == date(2026, 4, 5)
-
-    def test_new_zealand_summer_2026(self):
-        """New Zealand summer time 2026 = September 27th."""
-        region = DST_REGIONS_TEST["new_zealand"]
-        result = calculate_dst_date(region, "summer", 2026)
-        assert result == date(2026, 9, 27)
-
-    def test_new_zealand_winter_2026(self):
-        """New Zealand winter time 2026 = April 5th."""
-        region = DST_REGIONS_TEST["new_zealand"]
-        result = calculate_dst_date(region, "winter", 2026)
-        assert result == date(2026, 4, 5)
+    @pytest.mark.parametrize(
+        ("region_key", "dst_type", "year", "expected"),
+        [
+            pytest.param("eu", "summer", 2026, date(2026, 3, 29), id="eu_summer_2026"),
+            pytest.param("eu", "winter", 2026, date(2026, 10, 25), id="eu_winter_2026"),
+            pytest.param("usa", "summer", 2026, date(2026, 3, 8), id="usa_summer_2026"),
+            pytest.param("usa", "winter", 2026, date(2026, 11, 1), id="usa_winter_2026"),
+            pytest.param("australia", "summer", 2026, date(2026, 10, 4), id="australia_summer_2026"),
+            pytest.param("australia", "winter", 2026, date(2026, 4, 5), id="australia_winter_2026"),
+            pytest.param("new_zealand", "summer", 2026, date(2026, 9, 27), id="new_zealand_summer_2026"),
+            pytest.param("new_zealand", "winter", 2026, date(2026, 4, 5), id="new_zealand_winter_2026"),
+        ],
+    )
+    def test_region_transition(self, region_key, dst_type, year, expected):
+        """Each region's 2026 summer and winter transition dates."""
+        region = DST_REGIONS_TEST[region_key]
+        assert calculate_dst_date(region, dst_type, year) == expected
 
     def test_invalid_dst_type(self):
         """Invalid DST type returns None."""
@@ -959,76 +846,26 @@ class TestIsDstActive:
 class TestDstKnownDates:
     """Tests verifying known DST dates for multiple years."""
 
-    # EU known dates
-    def test_eu_summer_2025(self):
-        """EU summer 2025 = March 30th."""
-        region = DST_REGIONS_TEST["eu"]
-        result = calculate_dst_date(region, "summer", 2025)
-        assert result == date(2025, 3, 30)
-
-    def test_eu_winter_2025(self):
-        """EU winter 2025 = October 26th."""
-        region = DST_REGIONS_TEST["eu"]
-        result = calculate_dst_date(region, "winter", 2025)
-        assert result == date(2025, 10, 26)
-
-    def test_eu_summer_2027(self):
-        """EU summer 2027 = March 28th."""
-        region = DST_REGIONS_TEST["eu"]
-        result = calculate_dst_date(region, "summer", 2027)
-        assert result == date(2027, 3, 28)
-
-    def test_eu_winter_2027(self):
-        """EU winter 2027 = October 31st."""
-        region = DST_REGIONS_TEST["eu"]
-        result = calculate_dst_date(region, "winter", 2027)
-        assert result == date(2027, 10, 31)
-
-    def test_eu_summer_2028(self):
-        """EU summer 2028 = March 26th."""
-        region = DST_REGIONS_TEST["eu"]
-        result = calculate_dst_date(region, "summer", 2028)
-        assert result == date(2028, 3, 26)
-
-    def test_eu_winter_2028(self):
-        """EU winter 2028 = October 29th."""
-        region = DST_REGIONS_TEST["eu"]
-        result = calculate_dst_date(region, "winter", 2028)
-        assert result == date(2028, 10, 29)
-
-    # USA known dates
-    def test_usa_summer_2025(self):
-        """USA summer 2025 = March 9th."""
-        region = DST_REGIONS_TEST["usa"]
-        result = calculate_dst_date(region, "summer", 2025)
-        assert result == date(2025, 3, 9)
-
-    def test_usa_winter_2025(self):
-        """USA winter 2025 = November 2nd."""
-        region = DST_REGIONS_TEST["usa"]
-        result = calculate_dst_date(region, "winter", 2025)
-        assert result == date(2025, 11, 2)
-
-    def test_usa_summer_2027(self):
-        """USA summer 2027 = March 14th."""
-        region = DST_REGIONS_TEST["usa"]
-        result = calculate_dst_date(region, "summer", 2027)
-        assert result == date(2027, 3, 14)
-
-    def test_usa_winter_2027(self):
-        """USA winter 2027 = November 7th."""
-        region = DST_REGIONS_TEST["usa"]
-        result = calculate_dst_date(region, "winter", 2027)
-        assert result == date(2027, 11, 7)
-
-    def test_usa_summer_2028(self):
-        """USA summer 2028 = March 12th."""
-        region = DST_REGIONS_TEST["usa"]
-        result = calculate_dst_date(region, "summer", 2028)
-        assert result == date(2028, 3, 12)
-
-    def test_usa_winter_2028(self):
-        """USA winter 2028 = November 5th."""
-        region = DST_REGIONS_TEST["usa"]
-        result = calculate_dst_date(region, "winter", 2028)
-        assert result == date(2028, 11, 5)
+    @pytest.mark.parametrize(
+        ("region_key", "dst_type", "year", "expected"),
+        [
+            # EU known dates
+            pytest.param("eu", "summer", 2025, date(2025, 3, 30), id="eu_summer_2025"),
+            pytest.param("eu", "winter", 2025, date(2025, 10, 26), id="eu_winter_2025"),
+            pytest.param("eu", "summer", 2027, date(2027, 3, 28), id="eu_summer_2027"),
+            pytest.param("eu", "winter", 2027, date(2027, 10, 31), id="eu_winter_2027"),
+            pytest.param("eu", "summer", 2028, date(2028, 3, 26), id="eu_summer_2028"),
+            pytest.param("eu", "winter", 2028, date(2028, 10, 29), id="eu_winter_2028"),
+            # USA known dates
+            pytest.param("usa", "summer", 2025, date(2025, 3, 9), id="usa_summer_2025"),
+            pytest.param("usa", "winter", 2025, date(2025, 11, 2), id="usa_winter_2025"),
+            pytest.param("usa", "summer", 2027, date(2027, 3, 14), id="usa_summer_2027"),
+            pytest.param("usa", "winter", 2027, date(2027, 11, 7), id="usa_winter_2027"),
+            pytest.param("usa", "summer", 2028, date(2028, 3, 12), id="usa_summer_2028"),
+            pytest.param("usa", "winter", 2028, date(2028, 11, 5), id="usa_winter_2028"),
+        ],
+    )
+    def test_known_date(self, region_key, dst_type, year, expected):
+        """Known transition date for the region, type and year."""
+        region = DST_REGIONS_TEST[region_key]
+        assert calculate_dst_date(region, dst_type, year) == expected
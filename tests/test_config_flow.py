@@ -1,15 +1,30 @@
 """Tests for WhenHub config flow."""
+from datetime import date
+from unittest.mock import patch
+
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
 from custom_components.whenhub.const import DOMAIN
 
+PATCH_SETUP_ENTRY = "custom_components.whenhub.async_setup_entry"
+
+
+async def _start_flow(hass: HomeAssistant, event_type: str) -> dict:
+    """Start a user config flow and submit the event type step."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": "user"}
+    )
+    return await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {"event_type": event_type}
+    )
+
 
 class TestConfigFlowUserStep:
     """Tests for the initial user step of config flow."""
 
-    @pytest.mark.asyncio
     async def test_user_step_shows_event_type_form(self, hass: HomeAssistant):
         """Test that user step shows event type selection form."""
         result = await hass.config_entries.flow.async_init(
@@ -21,47 +36,23 @@ class TestConfigFlowUserStep:
         # Form should have event_type field
         assert "event_type" in result["data_schema"].schema
 
-    @pytest.mark.asyncio
     async def test_user_step_trip_routes_to_trip_step(self, hass: HomeAssistant):
         """Test that selecting trip event type routes to trip configuration."""
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": "user"}
-        )
-
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {"event_type": "trip"}
-        )
+        result = await _start_flow(hass, "trip")
 
         assert result["type"] == FlowResultType.FORM
         assert result["step_id"] == "trip"
 
-    @pytest.mark.asyncio
     async def test_user_step_milestone_routes_to_milestone_step(self, hass: HomeAssistant):
         """Test that selecting milestone event type routes to milestone configuration."""
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": "user"}
-        )
-
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {"event_type": "milestone"}
-        )
+        result = await _start_flow(hass, "milestone")
 
         assert result["type"] == FlowResultType.FORM
         assert result["step_id"] == "milestone"
 
-    @pytest.mark.asyncio
     async def test_user_step_special_routes_to_category_step(self, hass: HomeAssistant):
         """Test that selecting special event type routes to category selection."""
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": "user"}
-        )
-
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {"event_type": "special"}
-        )
+        result = await _start_flow(hass, "special")
 
         assert result["type"] == FlowResultType.FORM
         assert result["step_id"] == "special_category"
@@ -70,18 +61,10 @@ class TestConfigFlowUserStep:
 class TestConfigFlowSpecialEvents:
     """Tests for special event configuration in config flow."""
 
-    @pytest.mark.asyncio
     async def test_special_category_dst_routes_to_dst_step(self, hass: HomeAssistant):
         """Test that selecting DST category routes to DST configuration."""
-        # Start flow
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": "user"}
-        )
-        # Select special event type
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {"event_type": "special"}
-        )
+        # Start flow and select special event type
+        result = await _start_flow(hass, "special")
         # Select DST category
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
@@ -91,18 +74,10 @@ class TestConfigFlowSpecialEvents:
         assert result["type"] == FlowResultType.FORM
         assert result["step_id"] == "dst_event"
 
-    @pytest.mark.asyncio
     async def test_special_category_traditional_routes_to_special_step(self, hass: HomeAssistant):
         """Test that selecting traditional category routes to special event selection."""
-        # Start flow
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": "user"}
-        )
-        # Select special event type
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {"event_type": "special"}
-        )
+        # Start flow and select special event type
+        result = await _start_flow(hass, "special")
         # Select traditional category
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
@@ -116,56 +91,46 @@ class TestConfigFlowSpecialEvents:
 class TestConfigFlowCompleteFlow:
     """Tests for complete config flow from start to finish."""
 
-    @pytest.mark.asyncio
     async def test_complete_trip_flow(self, hass: HomeAssistant):
         """Test complete trip event creation flow."""
-        # Start flow
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": "user"}
-        )
-        # Select trip event type
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {"event_type": "trip"}
-        )
-        # Fill trip details
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {
-                "start_date": "2026-08-01",
-                "end_date": "2026-08-15",
-                "image_path": "",
-            }
-        )
+        # Start flow and select trip event type
+        result = await _start_flow(hass, "trip")
+        # Fill trip details; entry setup itself is covered by the sensor tests
+        with patch(PATCH_SETUP_ENTRY, return_value=True) as mock_setup_entry:
+            result = await hass.config_entries.flow.async_configure(
+                result["flow_id"],
+                {
+                    "start_date": "2026-08-01",
+                    "end_date": "2026-08-15",
+                    "image_path": "",
+                }
+            )
+            await hass.async_block_till_done()
 
         assert result["type"] == FlowResultType.CREATE_ENTRY
+        assert len(mock_setup_entry.mock_calls) == 1
         assert result["title"] == "Trip"
         assert result["data"]["event_type"] == "trip"
         assert result["data"]["start_date"] == "2026-08-01"
         assert result["data"]["end_date"] == "2026-08-15"
 
-    @pytest.mark.asyncio
     async def test_complete_milestone_flow(self, hass: HomeAssistant):
         """Test complete milestone event creation flow."""
-        # Start flow
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": "user"}
-        )
-        # Select milestone event type
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {"event_type": "milestone"}
-        )
+        # Start flow and select milestone event type
+        result = await _start_flow(hass, "milestone")
         # Fill milestone details
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {
-                "target_date": "2026-12-31",
-                "image_path": "",
-            }
-        )
+        with patch(PATCH_SETUP_ENTRY, return_value=True) as mock_setup_entry:
+            result = await hass.config_entries.flow.async_configure(
+                result["flow_id"],
+                {
+                    "target_date": "2026-12-31",
+                    "image_path": "",
+                }
+            )
+            await hass.async_block_till_done()
 
         assert result["type"] == FlowResultType.CREATE_ENTRY
+        assert len(mock_setup_entry.mock_calls) == 1
         assert result["title"] == "Milestone"
         assert result["data"]["event_type"] == "milestone"
         assert result["data"]["target_date"] == "2026-12-31"
@@ -174,27 +139,36 @@ class TestConfigFlowCompleteFlow:
 class TestOptionsFlow:
     """Tests for options flow (reconfiguring existing entries)."""
 
-    @pytest.mark.asyncio
-    async def test_options_flow_trip_shows_form(self, hass: HomeAssistant, trip_config_entry):
-        """Test that options flow for trip shows the correct form."""
-        trip_config_entry.add_to_hass(hass)
-        assert await hass.config_entries.async_setup(trip_config_entry.entry_id)
+    @pytest.mark.parametrize(
+        ("entry_fixture", "step_id", "expected_keys"),
+        [
+            pytest.param("trip_config_entry", "trip_options", ("start_date", "end_date"), id="trip"),
+            pytest.param("milestone_config_entry", "milestone_options", ("target_date",), id="milestone"),
+            pytest.param("anniversary_config_entry", "anniversary_options", ("target_date",), id="anniversary"),
+            pytest.param("special_config_entry", "special_options", ("image_path",), id="special"),
+            pytest.param("dst_eu_config_entry", "dst_options", ("dst_region",), id="dst"),
+        ],
+    )
+    async def test_options_flow_shows_form(
+        self, hass: HomeAssistant, request, entry_fixture, step_id, expected_keys
+    ):
+        """Test that the options flow shows the form for the entry's event type."""
+        config_entry = request.getfixturevalue(entry_fixture)
+        config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
         await hass.async_block_till_done()
 
         # Start options flow
-        result = await hass.config_entries.options.async_init(trip_config_entry.entry_id)
+        result = await hass.config_entries.options.async_init(config_entry.entry_id)
 
         assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "trip_options"
+        assert result["step_id"] == step_id
         # Form should have the expected fields
-        schema_keys = list(result["data_schema"].schema.keys())
-        assert any("start_date" in str(k) for k in schema_keys)
-        assert any("end_date" in str(k) for k in schema_keys)
+        key_names = {marker.schema for marker in result["data_schema"].schema}
+        assert set(expected_keys) <= key_names
 
-    @pytest.mark.asyncio
     async def test_options_flow_trip_update(self, hass: HomeAssistant, trip_config_entry):
         """Test that trip options can be updated."""
-        from datetime import date
         trip_config_entry.add_to_hass(hass)
         assert await hass.config_entries.async_setup(trip_config_entry.entry_id)
         await hass.async_block_till_done()
@@ -215,25 +189,8 @@ class TestOptionsFlow:
         assert result["type"] == FlowResultType.CREATE_ENTRY
         assert trip_config_entry.data["start_date"] == date(2026, 9, 1)
 
-    @pytest.mark.asyncio
-    async def test_options_flow_milestone_shows_form(self, hass: HomeAssistant, milestone_config_entry):
-        """Test that options flow for milestone shows the correct form."""
-        milestone_config_entry.add_to_hass(hass)
-        assert await hass.config_entries.async_setup(milestone_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        # Start options flow
-        result = await hass.config_entries.options.async_init(milestone_config_entry.entry_id)
-
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "milestone_options"
-        schema_keys = list(result["data_schema"].schema.keys())
-        assert any("target_date" in str(k) for k in schema_keys)
-
-    @pytest.mark.asyncio
     async def test_options_flow_milestone_update(self, hass: HomeAssistant, milestone_config_entry):
         """Test that milestone options can be updated."""
-        from datetime import date
         milestone_config_entry.add_to_hass(hass)
         assert await hass.config_entries.async_setup(milestone_config_entry.entry_id)
         await hass.async_block_till_done()
@@ -253,25 +210,8 @@ class TestOptionsFlow:
         assert result["type"] == FlowResultType.CREATE_ENTRY
         assert milestone_config_entry.data["target_date"] == date(2026, 6, 30)
 
-    @pytest.mark.asyncio
-    async def test_options_flow_anniversary_shows_form(self, hass: HomeAssistant, anniversary_config_entry):
-        """Test that options flow for anniversary shows the correct form."""
-        anniversary_config_entry.add_to_hass(hass)
-        assert await hass.config_entries.async_setup(anniversary_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        # Start options flow
-        result = await hass.config_entries.options.async_init(anniversary_config_entry.entry_id)
-
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "anniversary_options"
-        schema_keys = list(result["data_schema"].schema.keys())
-        assert any("target_date" in str(k) for k in schema_keys)
-
-    @pytest.mark.asyncio
     async def test_options_flow_anniversary_update(self, hass: HomeAssistant, anniversary_config_entry):
         """Test that anniversary options can be updated."""
-        from datetime import date
         anniversary_config_entry.add_to_hass(hass)
         assert await hass.config_entries.async_setup(anniversary_config_entry.entry_id)
         await hass.async_block_till_done()
@@ -291,22 +231,6 @@ class TestOptionsFlow:
         assert result["type"] == FlowResultType.CREATE_ENTRY
         assert anniversary_config_entry.data["target_date"] == date(2010, 6, 15)
 
-    @pytest.mark.asyncio
-    async def test_options_flow_special_shows_form(self, hass: HomeAssistant, special_config_entry):
-        """Test that options flow for special event shows the correct form."""
-        special_config_entry.add_to_hass(hass)
-        assert await hass.config_entries.async_setup(special_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        # Start options flow
-        result = await hass.config_entries.options.async_init(special_config_entry.entry_id)
-
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "special_options"
-        schema_keys = list(result["data_schema"].schema.keys())
-        assert any("image_path" in str(k) for k in schema_keys)
-
-    @pytest.mark.asyncio
     async def test_options_flow_special_update(self, hass: HomeAssistant, special_config_entry):
         """Test that special event options can be updated."""
         special_config_entry.add_to_hass(hass)
@@ -326,22 +250,6 @@ class TestOptionsFlow:
 
         assert result["type"] == FlowResultType.CREATE_ENTRY
 
-    @pytest.mark.asyncio
-    async def test_options_flow_dst_shows_form(self, hass: HomeAssistant, dst_eu_config_entry):
-        """Test that options flow for DST event shows the correct form."""
-        dst_eu_config_entry.add_to_hass(hass)
-        assert await hass.config_entries.async_setup(dst_eu_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        # Start options flow
-        result = await hass.config_entries.options.async_init(dst_eu_config_entry.entry_id)
-
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "dst_options"
-        schema_keys = list(result["data_schema"].schema.keys())
-        assert any("dst_region" in str(k) for k in schema_keys)
-
-    @pytest.mark.asyncio
     async def test_options_flow_dst_update(self, hass: HomeAssistant, dst_eu_config_entry):
         """Test that DST event options can be updated."""
         dst_eu_config_entry.add_to_hass(hass)
@@ -364,10 +272,8 @@ class TestOptionsFlow:
         assert result["type"] == FlowResultType.CREATE_ENTRY
         assert dst_eu_config_entry.data["dst_region"] == "eu"
 
-    @pytest.mark.asyncio
     async def test_options_flow_trip_invalid_dates(self, hass: HomeAssistant, trip_config_entry):
         """Test that trip options flow rejects invalid date range."""
-        from datetime import date
         trip_config_entry.add_to_hass(hass)
         assert await hass.config_entries.async_setup(trip_config_entry.entry_id)
         await hass.async_block_till_done()
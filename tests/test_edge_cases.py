@@ -1,282 +1,284 @@
 """Edge case tests for WhenHub integration."""
 import pytest
-from freezegun import freeze_time
 from homeassistant.core import HomeAssistant
 
-from conftest import get_date_from_state
+from conftest import get_date_from_state, snapshot_states
+
+
+# Entity IDs asserted on below, grouped by config entry fixture
+# Single day trip
+TAGESAUSFLUG_DAYS_UNTIL = "sensor.tagesausflug_days_until"
+TAGESAUSFLUG_DAYS_UNTIL_END = "sensor.tagesausflug_days_until_end"
+TAGESAUSFLUG_TRIP_LEFT_DAYS = "sensor.tagesausflug_trip_left_days"
+TAGESAUSFLUG_TRIP_ACTIVE_TODAY = "binary_sensor.tagesausflug_trip_active_today"
+TAGESAUSFLUG_TRIP_ENDS_TODAY = "binary_sensor.tagesausflug_trip_ends_today"
+TAGESAUSFLUG_TRIP_STARTS_TODAY = "binary_sensor.tagesausflug_trip_starts_today"
+# Past trip
+VERGANGENER_URLAUB_DAYS_UNTIL = "sensor.vergangener_urlaub_days_until"
+VERGANGENER_URLAUB_DAYS_UNTIL_END = "sensor.vergangener_urlaub_days_until_end"
+VERGANGENER_URLAUB_TRIP_LEFT_DAYS = "sensor.vergangener_urlaub_trip_left_days"
+VERGANGENER_URLAUB_TRIP_LEFT_PERCENT = "sensor.vergangener_urlaub_trip_left_percent"
+# Past milestone
+VERGANGENER_MILESTONE_DAYS_UNTIL = "sensor.vergangener_milestone_days_until"
+# Long trip
+WELTREISE_DAYS_UNTIL = "sensor.weltreise_days_until"
+WELTREISE_DAYS_UNTIL_END = "sensor.weltreise_days_until_end"
+WELTREISE_TRIP_ACTIVE_TODAY = "binary_sensor.weltreise_trip_active_today"
+# Leap year anniversary
+SCHALTJAHR_GEBURTSTAG_DAYS_UNTIL_NEXT = "sensor.schaltjahr_geburtstag_days_until_next"
+SCHALTJAHR_GEBURTSTAG_NEXT_DATE = "sensor.schaltjahr_geburtstag_next_date"
+# Easter
+OSTERN_DAYS_UNTIL = "sensor.ostern_days_until"
+OSTERN_NEXT_DATE = "sensor.ostern_next_date"
+# 1st Advent
+ADVENT_1_DAYS_UNTIL = "sensor.1_advent_days_until"
+ADVENT_1_NEXT_DATE = "sensor.1_advent_next_date"
 
 
 # =============================================================================
 # Single Day Trip Tests
 # =============================================================================
 
-@pytest.mark.asyncio
-async def test_single_day_trip_countdown(hass: HomeAssistant, single_day_trip_config_entry):
+async def test_single_day_trip_countdown(hass: HomeAssistant, single_day_trip_config_entry, fast_freeze_date):
     """Test single day trip (start = end) countdown works correctly."""
     single_day_trip_config_entry.add_to_hass(hass)
 
-    with freeze_time("2026-08-10 10:00:00+00:00"):  # 5 days before
-        assert await hass.config_entries.async_setup(single_day_trip_config_entry.entry_id)
-        await hass.async_block_till_done()
+    fast_freeze_date("2026-08-10")  # 5 days before
+    assert await hass.config_entries.async_setup(single_day_trip_config_entry.entry_id)
+    await hass.async_block_till_done()
+    states = snapshot_states(hass, "tagesausflug")
 
-        # Days until start
-        sensor = hass.states.get("sensor.tagesausflug_days_until")
-        assert sensor is not None
-        assert int(sensor.state) == 5
+    # Days until start
+    sensor = states.get(TAGESAUSFLUG_DAYS_UNTIL)
+    assert sensor is not None
+    assert int(sensor.state) == 5
 
-        # Days until end should also be 5 (same day)
-        sensor_end = hass.states.get("sensor.tagesausflug_days_until_end")
-        assert sensor_end is not None
-        assert int(sensor_end.state) == 5
+    # Days until end should also be 5 (same day)
+    sensor_end = states.get(TAGESAUSFLUG_DAYS_UNTIL_END)
+    assert sensor_end is not None
+    assert int(sensor_end.state) == 5
 
 
-@pytest.mark.asyncio
-async def test_single_day_trip_on_the_day(hass: HomeAssistant, single_day_trip_config_entry):
+async def test_single_day_trip_on_the_day(hass: HomeAssistant, single_day_trip_config_entry, fast_freeze_date):
     """Test single day trip sensors on the actual day."""
     single_day_trip_config_entry.add_to_hass(hass)
 
-    with freeze_time("2026-08-15 10:00:00+00:00"):  # The day itself
-        assert await hass.config_entries.async_setup(single_day_trip_config_entry.entry_id)
-        await hass.async_block_till_done()
+    fast_freeze_date("2026-08-15")  # The day itself
+    assert await hass.config_entries.async_setup(single_day_trip_config_entry.entry_id)
+    await hass.async_block_till_done()
+    states = snapshot_states(hass, "tagesausflug")
 
-        # All binary sensors should be on
-        starts = hass.states.get("binary_sensor.tagesausflug_trip_starts_today")
-        assert starts is not None
-        assert starts.state == "on"
+    # All binary sensors should be on
+    starts = states.get(TAGESAUSFLUG_TRIP_STARTS_TODAY)
+    assert starts is not None
+    assert starts.state == "on"
 
-        active = hass.states.get("binary_sensor.tagesausflug_trip_active_today")
-        assert active is not None
-        assert active.state == "on"
+    active = states.get(TAGESAUSFLUG_TRIP_ACTIVE_TODAY)
+    assert active is not None
+    assert active.state == "on"
 
-        ends = hass.states.get("binary_sensor.tagesausflug_trip_ends_today")
-        assert ends is not None
-        assert ends.state == "on"
+    ends = states.get(TAGESAUSFLUG_TRIP_ENDS_TODAY)
+    assert ends is not None
+    assert ends.state == "on"
 
-        # Trip left days should be 1 (today counts)
-        left = hass.states.get("sensor.tagesausflug_trip_left_days")
-        assert left is not None
-        assert int(left.state) == 1
+    # Trip left days should be 1 (today counts)
+    left = states.get(TAGESAUSFLUG_TRIP_LEFT_DAYS)
+    assert left is not None
+    assert int(left.state) == 1
 
 
 # =============================================================================
 # Past Events Tests (Negative Days)
 # =============================================================================
 
-@pytest.mark.asyncio
 async def test_past_trip_negative_days(hass: HomeAssistant, past_trip_config_entry):
     """Test that past trips show negative days correctly."""
     past_trip_config_entry.add_to_hass(hass)
 
-    with freeze_time("2026-01-15 10:00:00+00:00"):  # Well after the trip
-        assert await hass.config_entries.async_setup(past_trip_config_entry.entry_id)
-        await hass.async_block_till_done()
+    # No frozen date needed: the trip is in 2024, so any real today is after it
+    assert await hass.config_entries.async_setup(past_trip_config_entry.entry_id)
+    await hass.async_block_till_done()
+    states = snapshot_states(hass, "vergangener_urlaub")
 
-        # Days until start should be negative
-        sensor = hass.states.get("sensor.vergangener_urlaub_days_until")
-        assert sensor is not None
-        days = int(sensor.state)
-        assert days < 0  # Should be negative (trip was in 2024)
+    # Days until start should be negative
+    sensor = states.get(VERGANGENER_URLAUB_DAYS_UNTIL)
+    assert sensor is not None
+    days = int(sensor.state)
+    assert days < 0  # Should be negative (trip was in 2024)
 
-        # Days until end should also be negative
-        sensor_end = hass.states.get("sensor.vergangener_urlaub_days_until_end")
-        assert sensor_end is not None
-        days_end = int(sensor_end.state)
-        assert days_end < 0
+    # Days until end should also be negative
+    sensor_end = states.get(VERGANGENER_URLAUB_DAYS_UNTIL_END)
+    assert sensor_end is not None
+    days_end = int(sensor_end.state)
+    assert days_end < 0
 
-        # Trip left days should be 0
-        left = hass.states.get("sensor.vergangener_urlaub_trip_left_days")
-        assert left is not None
-        assert int(left.state) == 0
+    # Trip left days should be 0
+    left = states.get(VERGANGENER_URLAUB_TRIP_LEFT_DAYS)
+    assert left is not None
+    assert int(left.state) == 0
 
-        # Trip left percent should be 0
-        percent = hass.states.get("sensor.vergangener_urlaub_trip_left_percent")
-        assert percent is not None
-        assert float(percent.state) == 0.0
+    # Trip left percent should be 0
+    percent = states.get(VERGANGENER_URLAUB_TRIP_LEFT_PERCENT)
+    assert percent is not None
+    assert float(percent.state) == 0.0
 
 
-@pytest.mark.asyncio
 async def test_past_milestone_days(hass: HomeAssistant, past_milestone_config_entry):
     """Test that past milestones show correct values."""
     past_milestone_config_entry.add_to_hass(hass)
 
-    with freeze_time("2026-01-15 10:00:00+00:00"):  # 2 years after milestone
-        assert await hass.config_entries.async_setup(past_milestone_config_entry.entry_id)
-        await hass.async_block_till_done()
+    # No frozen date needed: the milestone is in 2024, so any real today is after it
+    assert await hass.config_entries.async_setup(past_milestone_config_entry.entry_id)
+    await hass.async_block_till_done()
+    states = snapshot_states(hass, "vergangener_milestone")
 
-        # Days until should be negative or 0
-        sensor = hass.states.get("sensor.vergangener_milestone_days_until")
-        assert sensor is not None
-        days = int(sensor.state)
-        assert days <= 0  # Past milestone
+    # Days until should be negative or 0
+    sensor = states.get(VERGANGENER_MILESTONE_DAYS_UNTIL)
+    assert sensor is not None
+    days = int(sensor.state)
+    assert days <= 0  # Past milestone
 
 
 # =============================================================================
 # Long Trip Tests (> 365 days)
 # =============================================================================
 
-@pytest.mark.asyncio
-async def test_long_trip_countdown(hass: HomeAssistant, long_trip_config_entry):
+async def test_long_trip_countdown(hass: HomeAssistant, long_trip_config_entry, fast_freeze_date):
     """Test very long trip (18 months) works correctly."""
     long_trip_config_entry.add_to_hass(hass)
 
-    with freeze_time("2025-12-01 10:00:00+00:00"):  # 31 days before start
-        assert await hass.config_entries.async_setup(long_trip_config_entry.entry_id)
-        await hass.async_block_till_done()
+    fast_freeze_date("2025-12-01")  # 31 days before start
+    assert await hass.config_entries.async_setup(long_trip_config_entry.entry_id)
+    await hass.async_block_till_done()
+    states = snapshot_states(hass, "weltreise")
 
-        # Days until start
-        sensor = hass.states.get("sensor.weltreise_days_until")
-        assert sensor is not None
-        assert int(sensor.state) == 31
+    # Days until start
+    sensor = states.get(WELTREISE_DAYS_UNTIL)
+    assert sensor is not None
+    assert int(sensor.state) == 31
 
-        # Days until end (should be 31 + 546 = 577 days)
-        sensor_end = hass.states.get("sensor.weltreise_days_until_end")
-        assert sensor_end is not None
-        days_until_end = int(sensor_end.state)
-        assert days_until_end > 365  # More than a year
+    # Days until end (should be 31 + 546 = 577 days)
+    sensor_end = states.get(WELTREISE_DAYS_UNTIL_END)
+    assert sensor_end is not None
+    days_until_end = int(sensor_end.state)
+    assert days_until_end > 365  # More than a year
 
 
-@pytest.mark.asyncio
-async def test_long_trip_during_trip(hass: HomeAssistant, long_trip_config_entry):
+async def test_long_trip_during_trip(hass: HomeAssistant, long_trip_config_entry, fast_freeze_date):
     """Test sensors during a very long trip."""
     long_trip_config_entry.add_to_hass(hass)
 
-    with freeze_time("2026-07-01 10:00:00+00:00"):  # 6 months into the trip
-        assert await hass.config_entries.async_setup(long_trip_config_entry.entry_id)
-        await hass.async_block_till_done()
+    fast_freeze_date("2026-07-01")  # 6 months into the trip
+    assert await hass.config_entries.async_setup(long_trip_config_entry.entry_id)
+    await hass.async_block_till_done()
+    states = snapshot_states(hass, "weltreise")
 
-        # Trip should be active
-        active = hass.states.get("binary_sensor.weltreise_trip_active_today")
-        assert active is not None
-        assert active.state == "on"
+    # Trip should be active
+    active = states.get(WELTREISE_TRIP_ACTIVE_TODAY)
+    assert active is not None
+    assert active.state == "on"
 
-        # Days until start should be negative (already started)
-        sensor = hass.states.get("sensor.weltreise_days_until")
-        assert sensor is not None
-        assert int(sensor.state) < 0
+    # Days until start should be negative (already started)
+    sensor = states.get(WELTREISE_DAYS_UNTIL)
+    assert sensor is not None
+    assert int(sensor.state) < 0
 
-        # Days until end should still be positive
-        sensor_end = hass.states.get("sensor.weltreise_days_until_end")
-        assert sensor_end is not None
-        assert int(sensor_end.state) > 0
+    # Days until end should still be positive
+    sensor_end = states.get(WELTREISE_DAYS_UNTIL_END)
+    assert sensor_end is not None
+    assert int(sensor_end.state) > 0
 
 
 # =============================================================================
 # Leap Year Tests
 # =============================================================================
 
-@pytest.mark.asyncio
-async def test_leap_year_anniversary_in_non_leap_year(hass: HomeAssistant, leap_year_anniversary_config_entry):
-    """Test Feb 29 anniversary handled correctly in non-leap year."""
+@pytest.mark.parametrize(
+    ("day", "expected_next", "expected_days"),
+    [
+        # 2025 is NOT a leap year: falls back to Feb 28 (Feb 20 -> Feb 28)
+        pytest.param("2025-02-20", "2025-02-28", 8, id="non_leap_year"),
+        # 2028 IS a leap year: Feb 29 (Feb 20 -> Feb 29)
+        pytest.param("2028-02-20", "2028-02-29", 9, id="leap_year"),
+    ],
+)
+async def test_leap_year_anniversary(
+    hass: HomeAssistant, leap_year_anniversary_config_entry, fast_freeze_date, day, expected_next, expected_days
+):
+    """Test Feb 29 anniversary in leap and non-leap years."""
     leap_year_anniversary_config_entry.add_to_hass(hass)
 
-    with freeze_time("2025-02-20 10:00:00+00:00"):  # 2025 is NOT a leap year
-        assert await hass.config_entries.async_setup(leap_year_anniversary_config_entry.entry_id)
-        await hass.async_block_till_done()
+    fast_freeze_date(day)
+    assert await hass.config_entries.async_setup(leap_year_anniversary_config_entry.entry_id)
+    await hass.async_block_till_done()
+    states = snapshot_states(hass, "schaltjahr_geburtstag")
 
-        # Next date should be Feb 28 (not Feb 29)
-        next_date = hass.states.get("sensor.schaltjahr_geburtstag_next_date")
-        assert next_date is not None
-        assert get_date_from_state(next_date.state) == "2025-02-28"  # Falls back to Feb 28
+    next_date = states.get(SCHALTJAHR_GEBURTSTAG_NEXT_DATE)
+    assert next_date is not None
+    assert get_date_from_state(next_date.state) == expected_next
 
-        # Days until should be 8 (Feb 20 -> Feb 28)
-        days = hass.states.get("sensor.schaltjahr_geburtstag_days_until_next")
-        assert days is not None
-        assert int(days.state) == 8
-
-
-@pytest.mark.asyncio
-async def test_leap_year_anniversary_in_leap_year(hass: HomeAssistant, leap_year_anniversary_config_entry):
-    """Test Feb 29 anniversary in actual leap year."""
-    leap_year_anniversary_config_entry.add_to_hass(hass)
-
-    with freeze_time("2028-02-20 10:00:00+00:00"):  # 2028 IS a leap year
-        assert await hass.config_entries.async_setup(leap_year_anniversary_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        # Next date should be Feb 29 (leap year!)
-        next_date = hass.states.get("sensor.schaltjahr_geburtstag_next_date")
-        assert next_date is not None
-        assert get_date_from_state(next_date.state) == "2028-02-29"
-
-        # Days until should be 9 (Feb 20 -> Feb 29)
-        days = hass.states.get("sensor.schaltjahr_geburtstag_days_until_next")
-        assert days is not None
-        assert int(days.state) == 9
+    days = states.get(SCHALTJAHR_GEBURTSTAG_DAYS_UNTIL_NEXT)
+    assert days is not None
+    assert int(days.state) == expected_days
 
 
 # =============================================================================
 # Easter Calculation Tests
 # =============================================================================
 
-@pytest.mark.asyncio
-async def test_easter_2026(hass: HomeAssistant, easter_config_entry):
-    """Test Easter calculation for 2026 (April 5, 2026)."""
+@pytest.mark.parametrize(
+    ("day", "expected_next", "expected_days"),
+    [
+        # Easter 2026 is April 5 (March 1 -> April 5 = 35 days)
+        pytest.param("2026-03-01", "2026-04-05", 35, id="2026"),
+        # Easter 2027 is March 28 (March 1 -> March 28 = 27 days)
+        pytest.param("2027-03-01", "2027-03-28", 27, id="2027"),
+    ],
+)
+async def test_easter(hass: HomeAssistant, easter_config_entry, fast_freeze_date, day, expected_next, expected_days):
+    """Test Easter calculation across years."""
     easter_config_entry.add_to_hass(hass)
 
-    with freeze_time("2026-03-01 10:00:00+00:00"):
-        assert await hass.config_entries.async_setup(easter_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        # Easter 2026 is April 5
-        next_date = hass.states.get("sensor.ostern_next_date")
-        assert next_date is not None
-        assert get_date_from_state(next_date.state) == "2026-04-05"
-
-        # Days until (March 1 -> April 5 = 35 days)
-        days = hass.states.get("sensor.ostern_days_until")
-        assert days is not None
-        assert int(days.state) == 35
+    fast_freeze_date(day)
+    assert await hass.config_entries.async_setup(easter_config_entry.entry_id)
+    await hass.async_block_till_done()
+    states = snapshot_states(hass, "ostern")
 
+    next_date = states.get(OSTERN_NEXT_DATE)
+    assert next_date is not None
+    assert get_date_from_state(next_date.state) == expected_next
 
-@pytest.mark.asyncio
-async def test_easter_2027(hass: HomeAssistant, easter_config_entry):
-    """Test Easter calculation for 2027 (March 28, 2027)."""
-    easter_config_entry.add_to_hass(hass)
-
-    with freeze_time("2027-03-01 10:00:00+00:00"):
-        assert await hass.config_entries.async_setup(easter_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        # Easter 2027 is March 28
-        next_date = hass.states.get("sensor.ostern_next_date")
-        assert next_date is not None
-        assert get_date_from_state(next_date.state) == "2027-03-28"
+    days = states.get(OSTERN_DAYS_UNTIL)
+    assert days is not None
+    assert int(days.state) == expected_days
 
 
 # =============================================================================
 # Advent Calculation Tests
 # =============================================================================
 
-@pytest.mark.asyncio
-async def test_advent_2026(hass: HomeAssistant, advent_config_entry):
-    """Test 1st Advent calculation for 2026 (November 29, 2026)."""
+@pytest.mark.parametrize(
+    ("day", "expected_next", "expected_days"),
+    [
+        # 1st Advent 2026 is November 29 (Nov 1 -> Nov 29 = 28 days)
+        pytest.param("2026-11-01", "2026-11-29", 28, id="2026"),
+        # 1st Advent 2025 is November 30 (Nov 1 -> Nov 30 = 29 days)
+        pytest.param("2025-11-01", "2025-11-30", 29, id="2025"),
+    ],
+)
+async def test_advent(hass: HomeAssistant, advent_config_entry, fast_freeze_date, day, expected_next, expected_days):
+    """Test 1st Advent calculation across years."""
     advent_config_entry.add_to_hass(hass)
 
-    with freeze_time("2026-11-01 10:00:00+00:00"):
-        assert await hass.config_entries.async_setup(advent_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        # 1st Advent 2026 is November 29
-        next_date = hass.states.get("sensor.1_advent_next_date")
-        assert next_date is not None
-        assert get_date_from_state(next_date.state) == "2026-11-29"
-
-        # Days until (Nov 1 -> Nov 29 = 28 days)
-        days = hass.states.get("sensor.1_advent_days_until")
-        assert days is not None
-        assert int(days.state) == 28
-
-
-@pytest.mark.asyncio
-async def test_advent_2025(hass: HomeAssistant, advent_config_entry):
-    """Test 1st Advent calculation for 2025 (November 30, 2025)."""
-    advent_config_entry.add_to_hass(hass)
+    fast_freeze_date(day)
+    assert await hass.config_entries.async_setup(advent_config_entry.entry_id)
+    await hass.async_block_till_done()
+    states = snapshot_states(hass, "1_advent")
 
-    with freeze_time("2025-11-01 10:00:00+00:00"):
-        assert await hass.config_entries.async_setup(advent_config_entry.entry_id)
-        await hass.async_block_till_done()
+    next_date = states.get(ADVENT_1_NEXT_DATE)
+    assert next_date is not None
+    assert get_date_from_state(next_date.state) == expected_next
 
-        # 1st Advent 2025 is November 30
-        next_date = hass.states.get("sensor.1_advent_next_date")
-        assert next_date is not None
-        assert get_date_from_state(next_date.state) == "2025-11-30"
+    days = states.get(ADVENT_1_DAYS_UNTIL)
+    assert days is not None
+    assert int(days.state) == expected_days